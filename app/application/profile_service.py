@@ -1,14 +1,47 @@
 """Profile application service - orchestrates natal chart and transit calculations."""
 
-from calendar import monthrange
-from datetime import UTC, date, datetime
+import functools
+from collections import OrderedDict
+from datetime import UTC, date, datetime, tzinfo
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from app.core.llm_formatter import format_monthly_profile, format_natal_chart, format_personal_profile
-from app.domain.models import BirthData
+from app.core.llm_formatter import (
+    HOUSE_NAME_TO_NUM,
+    format_monthly_profile,
+    format_natal_chart,
+    format_personal_profile,
+)
+from app.core.lru import lru_get, lru_put
+from app.domain.models import BirthData, NatalChart, Transit
 from app.domain.ports import IAstrologyProvider
 from app.models.responses import PlacementItem, PlacementsResponse
 
+# Defaulted "now" transits are floored to this bucket so repeat requests reuse one
+# calculation; even the Moon moves only ~0.13 deg in 14 minutes.
+TRANSIT_BUCKET_SECONDS = 14 * 60
+# Defaulted "now" transits memoized per service instance (least recently used evicted first).
+# A cached Transit holds its full planet and aspect data (~55 KB), so the bound covers a
+# handful of people requested within one bucket rather than a whole user base (~1.8 MB per process).
+TRANSIT_CACHE_SIZE = 32
+
+_LAST_DAY_OF_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _month_last_day(year: int, month: int) -> int:
+    """Number of days in a Gregorian month."""
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _LAST_DAY_OF_MONTH[month - 1]
+
+
+@functools.lru_cache(maxsize=512)
+def _safe_zoneinfo(timezone_name: str) -> tzinfo:
+    """Resolve an IANA timezone name, memoizing both hits and the UTC fallback for invalid names."""
+    try:
+        return ZoneInfo(timezone_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return UTC
+
 
 class ProfileService:
     """
@@ -25,6 +58,24 @@ class ProfileService:
             provider: Astrology calculation provider (injected dependency)
         """
         self.provider = provider
+        self._transit_cache: OrderedDict[tuple, Transit] = OrderedDict()
+
+    @staticmethod
+    def _floor_to_transit_bucket(moment: datetime) -> datetime:
+        """Floor an aware datetime to the start of its TRANSIT_BUCKET_SECONDS window, keeping its timezone."""
+        timestamp = moment.timestamp()
+        return datetime.fromtimestamp(timestamp - timestamp % TRANSIT_BUCKET_SECONDS, tz=moment.tzinfo)
+
+    def _calculate_bucketed_transits(self, natal_chart: NatalChart, transit_date: datetime) -> Transit:
+        """Calculate transits for a bucketed default 'now', memoized by birth data and the bucket instant."""
+        key = (natal_chart.birth_data.cache_key(), transit_date.isoformat())
+        cached = lru_get(self._transit_cache, key)
+        if cached is not None:
+            return cached
+
+        transits = self.provider.calculate_transits(natal_chart, transit_date)
+        lru_put(self._transit_cache, key, transits, TRANSIT_CACHE_SIZE)
+        return transits
 
     @staticmethod
     def _resolve_now_for_birth_timezone(birth_data: BirthData) -> datetime:
@@ -33,11 +84,7 @@ class ProfileService:
 
         Falls back to UTC for invalid timezone strings.
         """
-        timezone_name = birth_data.timezone or "UTC"
-        try:
-            return datetime.now(ZoneInfo(timezone_name))
-        except (ZoneInfoNotFoundError, ValueError):
-            return datetime.now(UTC)
+        return datetime.now(_safe_zoneinfo(birth_data.timezone or "UTC"))
 
     def generate_profile(self, birth_data: BirthData, transit_date: datetime | None = None) -> dict:
         """
@@ -45,7 +92,7 @@ class ProfileService:
 
         Args:
             birth_data: Birth information
-            transit_date: Date for transit calculation (defaults to now)
+            transit_date: Date for transit calculation (defaults to now, floored to a 14-minute bucket)
 
         Returns:
             Dict containing natal chart data, natal aspects, and current transits
@@ -53,11 +100,13 @@ class ProfileService:
         # Calculate natal chart
         natal_chart = self.provider.calculate_natal_chart(birth_data)
 
-        # Calculate transits (default to now if not specified)
+        # Calculate transits (default to now if not specified). Only the bucketed default is
+        # cached: explicit transit dates rarely repeat and would evict the "now" entries.
         if transit_date is None:
-            transit_date = self._resolve_now_for_birth_timezone(birth_data)
-
-        transits = self.provider.calculate_transits(natal_chart, transit_date)
+            transit_date = self._floor_to_transit_bucket(self._resolve_now_for_birth_timezone(birth_data))
+            transits = self._calculate_bucketed_transits(natal_chart, transit_date)
+        else:
+            transits = self.provider.calculate_transits(natal_chart, transit_date)
 
         # Build response
         return {
@@ -84,7 +133,7 @@ class ProfileService:
 
         Args:
             birth_data: Birth information
-            transit_date: Date for transit calculation (defaults to now)
+            transit_date: Date for transit calculation (defaults to now, floored to a 14-minute bucket)
 
         Returns:
             Compact text format optimized for LLM consumption (~80% token reduction)
@@ -105,7 +154,7 @@ class ProfileService:
 
         Args:
             birth_data: Birth information
-            transit_date: Date for transit calculation (defaults to now)
+            transit_date: Date for transit calculation (defaults to now, floored to a 14-minute bucket)
 
         Returns:
             Compact text excluding current sky positions
@@ -145,7 +194,7 @@ class ProfileService:
         # Calculate current month date range
         today = self._resolve_now_for_birth_timezone(birth_data).date()
         first_day = date(today.year, today.month, 1)
-        last_day = date(today.year, today.month, monthrange(today.year, today.month)[1])
+        last_day = date(today.year, today.month, _month_last_day(today.year, today.month))
 
         # Calculate monthly transits using transit periods
         transit_result = self.provider.calculate_transit_periods(
@@ -184,13 +233,7 @@ class ProfileService:
         if isinstance(house_value, int):
             return house_value
         # Kerykeion returns strings like "First_House", "Tenth_House", etc.
-        house_map = {
-            "first_house": 1, "second_house": 2, "third_house": 3,
-            "fourth_house": 4, "fifth_house": 5, "sixth_house": 6,
-            "seventh_house": 7, "eighth_house": 8, "ninth_house": 9,
-            "tenth_house": 10, "eleventh_house": 11, "twelfth_house": 12,
-        }
-        return house_map.get(str(house_value).lower())
+        return HOUSE_NAME_TO_NUM.get(str(house_value).lower())
 
     def generate_placements(self, birth_data: BirthData) -> PlacementsResponse:
         """
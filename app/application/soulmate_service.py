@@ -9,15 +9,16 @@ from kerykeion import RelationshipScoreFactory
 
 from app.domain.models import BirthData, NatalChart
 from app.domain.ports import IAstrologyProvider
-from app.infrastructure.providers.kerykeion_provider import KerykeionProvider
+from app.domain.zodiac import ZODIAC_SIGNS
+from app.infrastructure.providers.kerykeion_provider import (
+    EphemerisTable,
+    KerykeionProvider,
+)
 from app.models.soulmate import SoulmateChartResponse
 
 # Zodiac constants for derivation logic
-# Note: Kerykeion uses abbreviated sign names (Ari, Tau, Gem, etc.)
-ZODIAC_SIGNS = [
-    "Ari", "Tau", "Gem", "Can", "Leo", "Vir",
-    "Lib", "Sco", "Sag", "Cap", "Aqu", "Pis",
-]
+# Note: Kerykeion uses abbreviated sign names (Ari, Tau, Gem, etc.). ZODIAC_SIGNS comes from
+# the domain layer, which the provider also uses to decode EphemerisTable sign indices.
 
 OPPOSITE_SIGNS: dict[str, str] = {
     "Ari": "Lib", "Tau": "Sco", "Gem": "Sag", "Can": "Cap",
@@ -328,6 +329,12 @@ class SoulmateService:
         """
         self.provider = provider
 
+    def _calculate_probe_chart(self, birth_data: BirthData) -> NatalChart:
+        """Calculate a throwaway search chart, bypassing the provider's chart cache when it has one."""
+        if isinstance(self.provider, KerykeionProvider):
+            return self.provider.calculate_natal_chart_uncached(birth_data)
+        return self.provider.calculate_natal_chart(birth_data)
+
     def generate_soulmate_chart(
         self,
         user_birth_data: BirthData,
@@ -561,23 +568,33 @@ class SoulmateService:
 
         # Generate ephemeris for entire search range
         if isinstance(self.provider, KerykeionProvider):
-            ephemeris_points = self.provider.generate_ephemeris_for_range(
+            ephemeris = self.provider.generate_ephemeris_for_range(
                 start_date=date(min_birth_year, 1, 1),
                 end_date=date(max_birth_year, 12, 31),
                 location=user_birth_data,
             )
         else:
-            ephemeris_points = []
+            ephemeris = EphemerisTable.empty()
 
         # Pre-filter for Sun-Moon conjunction candidates
         # We want dates where:
         #   - Soulmate Sun is within 10° of user Moon, OR
         #   - Soulmate Moon is within 10° of user Sun
         # This gives the best chance of hitting 11-point cross-conjunctions
+        # Scans the ephemeris columns directly; rows are only built for the final candidates
+        n_points = len(ephemeris)
+        sun_positions = ephemeris.longitudes["sun"]
+        moon_positions = ephemeris.longitudes["moon"]
+        sun_sign_nums = ephemeris.signs["sun"]
+        user_sun_sign = user_chart.planets.get("sun", {}).get("sign", "Ari")
+        user_sun_quality = SUN_QUALITY.get(user_sun_sign, "Fixed")
+        # Destiny Sign lookup by sign index, so the scan below never touches sign strings
+        is_destiny_sign = tuple(SUN_QUALITY[sign] == user_sun_quality for sign in ZODIAC_SIGNS)
+
         candidates = []
-        for point in ephemeris_points:
-            sm_sun_pos = point.sun.abs_pos
-            sm_moon_pos = point.moon.abs_pos
+        for index in range(n_points):
+            sm_sun_pos = sun_positions[index]
+            sm_moon_pos = moon_positions[index]
 
             # Check Sun-Moon conjunction potential (within 10°)
             sun_moon_diff = abs(sm_sun_pos - user_moon_pos) % 360
@@ -597,14 +614,11 @@ class SoulmateService:
                 conjunction_score += 20 - moon_sun_diff  # 10-20 points
 
             # Also include dates with good Sun-Sun aspects (same modality = Destiny Sign)
-            user_sun_sign = user_chart.planets.get("sun", {}).get("sign", "Ari")
-            user_sun_quality = SUN_QUALITY.get(user_sun_sign, "Fixed")
-            point_sun_quality = SUN_QUALITY.get(point.sun.sign, "Fixed")
-            if point_sun_quality == user_sun_quality:
+            if is_destiny_sign[sun_sign_nums[index]]:
                 conjunction_score += 5  # Destiny Sign bonus
 
             if conjunction_score > 0:
-                candidates.append((conjunction_score, point))
+                candidates.append((conjunction_score, index))
 
         # Sort by pre-score descending, take top 100 candidates
         candidates.sort(key=lambda x: -x[0])
@@ -612,10 +626,10 @@ class SoulmateService:
 
         # If no good candidates, include all ephemeris points (O(n) with set)
         if len(top_candidates) < 50:
-            existing_ids = {id(p) for _, p in top_candidates}
-            for point in ephemeris_points:
-                if id(point) not in existing_ids:
-                    top_candidates.append((0, point))
+            existing_indices = {index for _, index in top_candidates}
+            for index in range(n_points):
+                if index not in existing_indices:
+                    top_candidates.append((0, index))
                     if len(top_candidates) >= 100:
                         break
 
@@ -624,7 +638,8 @@ class SoulmateService:
         best_chart = None
         best_score = -1
 
-        for _, point in top_candidates:
+        for _, index in top_candidates:
+            point = ephemeris.row(index)
             # Find hour that produces target Ascendant
             target_hour, target_minute = self._find_hour_for_ascendant_fast(
                 point.year,
@@ -647,7 +662,7 @@ class SoulmateService:
                 longitude=user_birth_data.longitude,
                 timezone=user_birth_data.timezone,
             )
-            soulmate_chart = self.provider.calculate_natal_chart(birth_data)
+            soulmate_chart = self._calculate_probe_chart(birth_data)
 
             # Score with actual RelationshipScoreFactory + North Node
             score = self._calculate_relationship_score(user_chart, soulmate_chart)
@@ -680,7 +695,7 @@ class SoulmateService:
                 longitude=user_birth_data.longitude,
                 timezone=user_birth_data.timezone,
             )
-            best_chart = self.provider.calculate_natal_chart(best_birth_data)
+            best_chart = self._calculate_probe_chart(best_birth_data)
             best_score = self._calculate_relationship_score(user_chart, best_chart)
 
         return (best_birth_data, best_chart, best_score)
@@ -754,7 +769,7 @@ class SoulmateService:
             timezone=timezone,
         )
         try:
-            midnight_chart = self.provider.calculate_natal_chart(midnight_birth)
+            midnight_chart = self._calculate_probe_chart(midnight_birth)
             midnight_asc = midnight_chart.points.get("ascendant", {}).get("abs_pos", 0.0)
         except Exception:
             return (12, 0)  # Fallback to noon
@@ -777,7 +792,7 @@ class SoulmateService:
             timezone=timezone,
         )
         try:
-            chart = self.provider.calculate_natal_chart(verify_birth)
+            chart = self._calculate_probe_chart(verify_birth)
             actual_sign = chart.points.get("ascendant", {}).get("sign", "")
             if actual_sign == target_rising_sign:
                 return (est_hour, est_minute)
@@ -841,7 +856,7 @@ class SoulmateService:
                     timezone=timezone,
                 )
                 try:
-                    chart = self.provider.calculate_natal_chart(birth)
+                    chart = self._calculate_probe_chart(birth)
                 except Exception:
                     # Skip times that hit DST transitions or other timezone issues
                     continue
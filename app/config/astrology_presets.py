@@ -5,6 +5,7 @@ This module defines configurable granularity levels for astrological calculation
 Different API endpoints can select different presets based on their needs
 (e.g., LLM-optimized vs comprehensive data).
 """
+import functools
 from dataclasses import dataclass
 from enum import StrEnum
 
@@ -18,18 +19,19 @@ class DetailLevel(StrEnum):
     COMPREHENSIVE = "comprehensive"  # Full detailed data
 
 
-@dataclass
+@dataclass(frozen=True)
 class AstrologyConfig:
     """Configuration for astrological calculations.
 
     Controls which celestial bodies, houses, and aspect orbs to include
-    in natal charts, transits, and synastry calculations.
+    in natal charts, transits, and synastry calculations. Immutable, since
+    presets are shared between all callers.
     """
 
     # Celestial bodies
-    planets: list[str]
-    points: list[str]
-    houses: list[str]
+    planets: tuple[str, ...]
+    points: tuple[str, ...]
+    houses: tuple[str, ...]
 
     # Aspect orb tolerances (in degrees)
     natal_orb: float       # For natal chart aspects
@@ -40,9 +42,12 @@ class AstrologyConfig:
     description: str
 
 
+@functools.lru_cache(maxsize=len(DetailLevel))
 def get_preset(level: DetailLevel) -> AstrologyConfig:
     """Get configuration preset for specified detail level.
 
+    Presets are built once per level and the same instance is returned afterwards.
+
     Args:
         level: The detail level preset to load
 
@@ -52,18 +57,18 @@ def get_preset(level: DetailLevel) -> AstrologyConfig:
     Example:
         >>> config = get_preset(DetailLevel.CORE)
         >>> config.planets
-        ['sun', 'moon', 'mercury', ...]
+        ('sun', 'moon', 'mercury', ...)
     """
 
     if level == DetailLevel.MINIMAL:
         # Ultra-lightweight: 7 personal planets, angular houses only
         return AstrologyConfig(
-            planets=[
+            planets=(
                 "sun", "moon", "mercury", "venus", "mars",
                 "jupiter", "saturn"
-            ],
-            points=["ascendant", "medium_coeli"],
-            houses=["first_house", "fourth_house", "seventh_house", "tenth_house"],
+            ),
+            points=("ascendant", "medium_coeli"),
+            houses=("first_house", "fourth_house", "seventh_house", "tenth_house"),
             natal_orb=3.0,
             transit_orb=3.0,
             synastry_orb=6.0,
@@ -73,16 +78,16 @@ def get_preset(level: DetailLevel) -> AstrologyConfig:
     elif level == DetailLevel.CORE:
         # Current LLM-optimized configuration (existing behavior)
         return AstrologyConfig(
-            planets=[
+            planets=(
                 "sun", "moon", "mercury", "venus", "mars",
                 "jupiter", "saturn", "uranus", "neptune", "pluto"
-            ],
-            points=["ascendant", "medium_coeli"],
-            houses=[
+            ),
+            points=("ascendant", "medium_coeli"),
+            houses=(
                 "first_house", "second_house", "third_house", "fourth_house",
                 "fifth_house", "sixth_house", "seventh_house", "eighth_house",
                 "ninth_house", "tenth_house", "eleventh_house", "twelfth_house"
-            ],
+            ),
             natal_orb=4.0,
             transit_orb=4.0,
             synastry_orb=8.0,
@@ -92,21 +97,21 @@ def get_preset(level: DetailLevel) -> AstrologyConfig:
     elif level == DetailLevel.ESSENTIAL:
         # More comprehensive: adds nodes, chiron, more houses
         return AstrologyConfig(
-            planets=[
+            planets=(
                 "sun", "moon", "mercury", "venus", "mars",
                 "jupiter", "saturn", "uranus", "neptune", "pluto",
                 "chiron"
-            ],
-            points=[
+            ),
+            points=(
                 "ascendant", "medium_coeli",
                 "descendant", "imum_coeli",
                 "mean_node"  # North Node
-            ],
-            houses=[
+            ),
+            houses=(
                 "first_house", "second_house", "third_house", "fourth_house",
                 "fifth_house", "sixth_house", "seventh_house", "eighth_house",
                 "tenth_house", "eleventh_house", "twelfth_house"
-            ],
+            ),
             natal_orb=6.0,
             transit_orb=6.0,
             synastry_orb=8.0,
@@ -116,21 +121,21 @@ def get_preset(level: DetailLevel) -> AstrologyConfig:
     elif level == DetailLevel.COMPREHENSIVE:
         # Full detailed data: all bodies, all houses, all points, wider orbs
         return AstrologyConfig(
-            planets=[
+            planets=(
                 "sun", "moon", "mercury", "venus", "mars",
                 "jupiter", "saturn", "uranus", "neptune", "pluto",
                 "chiron", "true_node", "mean_node"
-            ],
-            points=[
+            ),
+            points=(
                 "ascendant", "medium_coeli",
                 "descendant", "imum_coeli",
                 "mean_lilith", "true_lilith"
-            ],
-            houses=[
+            ),
+            houses=(
                 "first_house", "second_house", "third_house", "fourth_house",
                 "fifth_house", "sixth_house", "seventh_house", "eighth_house",
                 "ninth_house", "tenth_house", "eleventh_house", "twelfth_house"
-            ],
+            ),
             natal_orb=8.0,
             transit_orb=8.0,
             synastry_orb=8.0,
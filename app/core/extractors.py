@@ -1,11 +1,12 @@
 """Shared extraction utilities for DRY compliance."""
 
+from collections.abc import Sequence
 from typing import Any
 
 
 def extract_celestial_objects(
     subject: Any,
-    object_names: list[str],
+    object_names: Sequence[str],
     exclude_fields: set[str] | None = None
 ) -> dict[str, Any]:
     """
@@ -15,7 +16,7 @@ def extract_celestial_objects(
 
     Args:
         subject: Kerykeion astrological subject
-        object_names: List of attribute names to extract (e.g., ['sun', 'moon'])
+        object_names: Attribute names to extract (e.g., ['sun', 'moon'])
         exclude_fields: Fields to exclude from model_dump
 
     Returns:
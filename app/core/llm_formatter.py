@@ -6,7 +6,6 @@ to reduce token usage when passing to LLMs (~80% reduction).
 Output style: "Sun in Aries 15 deg (H1, Rx)", "Sun conjunct Moon (orb 2.3)"
 """
 
-import math
 from typing import Any
 
 # Essential fields to keep when simplifying data
@@ -97,12 +96,13 @@ def filter_aspects(aspects: list[dict], filter_generational: bool = True) -> lis
     return filtered
 
 
-# House name to number mapping
-HOUSE_NAME_TO_NUM = {
-    "first_house": 1, "second_house": 2, "third_house": 3, "fourth_house": 4,
-    "fifth_house": 5, "sixth_house": 6, "seventh_house": 7, "eighth_house": 8,
-    "ninth_house": 9, "tenth_house": 10, "eleventh_house": 11, "twelfth_house": 12,
-}
+# House names in house-number order, and the derived name to number mapping
+_HOUSE_NAMES: tuple[str, ...] = (
+    "first_house", "second_house", "third_house", "fourth_house",
+    "fifth_house", "sixth_house", "seventh_house", "eighth_house",
+    "ninth_house", "tenth_house", "eleventh_house", "twelfth_house",
+)
+HOUSE_NAME_TO_NUM: dict[str, int] = {name: num for num, name in enumerate(_HOUSE_NAMES, start=1)}
 
 
 def _normalize_house(house: Any) -> str | None:
@@ -169,62 +169,85 @@ def format_aspect(aspect: dict[str, Any], prefix1: str = "", prefix2: str = "")
     return f"{prefix1}{p1} {aspect_type} {prefix2}{p2} (orb {abs(orbit):.1f})"
 
 
-def _find_natal_house(abs_pos: float, natal_houses: dict[str, Any]) -> int | None:
-    """Find which natal house a planet falls in based on ecliptic position.
+def _find_natal_houses(
+    positions: list[float | None],
+    natal_houses: dict[str, Any],
+) -> list[int | None]:
+    """Find natal houses for several ecliptic positions in one pass.
+
+    Cusps are read from natal_houses once and shared by every position,
+    rather than re-extracted per planet.
 
     Args:
-        abs_pos: Absolute ecliptic position (0-360 degrees)
+        positions: Absolute ecliptic positions (None entries stay None)
         natal_houses: Natal houses dict with house_name -> {abs_pos, ...}
 
     Returns:
-        House number (1-12) or None if houses lack abs_pos data
+        House number (1-12) or None for each position, in input order
+    """
+    cusp_positions, house_nums = _natal_cusp_table(natal_houses)
+    return [
+        None if abs_pos is None else _nearest_cusp_house(float(abs_pos), cusp_positions, house_nums)
+        for abs_pos in positions
+    ]
+
+
+def _natal_cusp_table(natal_houses: dict[str, Any]) -> tuple[tuple[float, ...], tuple[int, ...]]:
+    """Split natal houses into parallel (cusp positions, house numbers) tuples.
+
+    Houses without a recognizable name or abs_pos are skipped.
     """
-    cusps: list[tuple[int, float]] = []
+    cusp_positions: list[float] = []
+    house_nums: list[int] = []
     for house_name, house_data in natal_houses.items():
         if not isinstance(house_data, dict):
             continue
         house_num = HOUSE_NAME_TO_NUM.get(house_name.lower().replace(" ", "_"))
         house_pos = house_data.get("abs_pos")
         if house_num is not None and house_pos is not None:
-            cusps.append((house_num, float(house_pos)))
-    if not cusps:
-        return None
-    cusps.sort(key=lambda c: c[1])
-    for i in range(len(cusps)):
-        current_num, current_pos = cusps[i]
-        next_pos = cusps[(i + 1) % len(cusps)][1]
-        if next_pos <= current_pos:
-            # Wrap-around: next cusp is past 360
-            if abs_pos >= current_pos or abs_pos < next_pos:
-                return current_num
-        else:
-            if current_pos <= abs_pos < next_pos:
-                return current_num
-    return cusps[-1][0]
+            cusp_positions.append(float(house_pos))
+            house_nums.append(house_num)
+    return tuple(cusp_positions), tuple(house_nums)
+
+
+def _nearest_cusp_house(
+    abs_pos: float,
+    cusp_positions: tuple[float, ...],
+    house_nums: tuple[int, ...],
+) -> int | None:
+    """Return the house whose cusp abs_pos lies the shortest distance past.
+
+    The planet belongs to the cusp it is the shortest counter-clockwise
+    distance past, i.e. the minimum of (abs_pos - cusp) % 360 over all cusps.
+    The modulo folds the 360/0 wrap-around into the same comparison.
+    Plain numeric loop over the precomputed cusp table; returns None when
+    the table is empty.
+    """
+    best_house: int | None = None
+    best_distance = 361.0
+    for cusp_pos, house_num in zip(cusp_positions, house_nums):
+        distance = (abs_pos - cusp_pos) % 360.0
+        if distance < best_distance:
+            best_distance = distance
+            best_house = house_num
+    return best_house
 
 
-def _format_transit_planet(planet_data: dict[str, Any], natal_houses: dict[str, Any]) -> str:
+def _format_transit_planet(planet_data: dict[str, Any], natal_house: int | None) -> str:
     """Format a transit planet with corrected natal house placement.
 
-    If abs_pos and natal houses are available, computes the correct natal house.
-    Otherwise strips the house entirely (better none than wrong).
+    If the natal house could be computed (abs_pos and natal houses available),
+    it replaces the transit chart's house. Otherwise strips the house entirely
+    (better none than wrong).
 
     Args:
         planet_data: Transit planet data dict
-        natal_houses: Natal chart houses dict
+        natal_house: Natal house the planet falls in, or None if unknown
 
     Returns:
         Formatted planet string with corrected house
     """
-    abs_pos = planet_data.get("abs_pos")
-    if abs_pos is not None and natal_houses:
-        natal_house = _find_natal_house(float(abs_pos), natal_houses)
-        if natal_house is not None:
-            corrected = {**planet_data, "house": natal_house}
-            return format_planet(corrected)
-    # Strip house entirely — better no house than wrong house
-    stripped = {**planet_data, "house": None}
-    return format_planet(stripped)
+    return format_planet({**planet_data, "house": natal_house})
 
 
 def _format_natal_sections(chart_data: dict[str, Any]) -> list[str]:
@@ -327,9 +350,10 @@ def format_natal_chart(chart_data: dict[str, Any]) -> str:
     transit_planets = transits.get("planets", {})
     if transit_planets:
         lines.append("CURRENT TRANSITS")
-        for planet_key, planet_data in transit_planets.items():
-            if isinstance(planet_data, dict) and "name" in planet_data:
-                lines.append(_format_transit_planet(planet_data, natal_houses))
+        planets = [p for p in transit_planets.values() if isinstance(p, dict) and "name" in p]
+        natal_house_nums = _find_natal_houses([p.get("abs_pos") for p in planets], natal_houses or {})
+        for planet_data, natal_house in zip(planets, natal_house_nums):
+            lines.append(_format_transit_planet(planet_data, natal_house))
         lines.append("")
 
     lines.extend(_format_transit_to_natal_aspects(chart_data))
@@ -555,9 +579,8 @@ def _score_to_percentage(score: int) -> int:
     Returns:
         Percentage value 0-100
     """
-    if score <= 0:
-        return 0
-    return min(100, round(math.sqrt(score / 30) * 100))
+    clamped = max(0, min(30, score))
+    return int((clamped / 30) ** 0.5 * 100 + 0.5)
 
 
 def format_synastry(synastry_data: dict[str, Any]) -> str:
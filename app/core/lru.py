@@ -0,0 +1,20 @@
+"""Bounded LRU helpers over OrderedDict, shared by the provider and application caches."""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+def lru_get(cache: OrderedDict, key: Hashable) -> Any | None:
+    """Return the cached value for key (marking it most recently used), or None on a miss."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def lru_put(cache: OrderedDict, key: Hashable, value: Any, max_size: int) -> None:
+    """Insert into an LRU OrderedDict, evicting the least recently used entry when full."""
+    cache[key] = value
+    if len(cache) > max_size:
+        cache.popitem(last=False)
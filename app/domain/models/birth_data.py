@@ -22,6 +22,7 @@ class BirthData(BaseModel):
     timezone: str | None = Field("Europe/London", description="IANA timezone (defaults to Europe/London)")
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "year": 1990,
@@ -46,3 +47,7 @@ class BirthData(BaseModel):
         if '/' not in v:
             raise ValueError("Timezone must be in IANA format (e.g., 'America/New_York')")
         return v
+
+    def cache_key(self) -> tuple:
+        """Hashable identity over the birth fields (fields added by request subclasses are ignored)."""
+        return tuple(getattr(self, field_name) for field_name in BirthData.model_fields)
@@ -0,0 +1,7 @@
+"""Zodiac sign constants shared across layers."""
+
+# Kerykeion's abbreviated sign names in zodiac order (index 0 = Aries)
+ZODIAC_SIGNS = [
+    "Ari", "Tau", "Gem", "Can", "Leo", "Vir",
+    "Lib", "Sco", "Sag", "Cap", "Aqu", "Pis",
+]
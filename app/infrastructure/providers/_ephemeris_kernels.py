@@ -0,0 +1,53 @@
+"""Column-wise kernels for ephemeris generation (pure Python, stdlib arrays)."""
+
+from array import array
+from collections.abc import Callable
+
+
+def longitudes_to_signs(longitudes: array) -> array:
+    """Map ecliptic longitudes (degrees) to zodiac sign indices 0-11 (0 = Aries).
+
+    Longitudes of exactly 360 wrap to Aries.
+    """
+    return array('b', [int(lon // 30.0) % 12 for lon in longitudes])
+
+
+def strided_longitudes(
+    calc: Callable[[int], float],
+    n_points: int,
+    stride: int,
+    max_motion: float,
+) -> array:
+    """Longitudes for rows 0..n_points-1, calling calc(row) only every `stride` rows.
+
+    Rows between two computed rows are linearly interpolated along the shorter arc.
+    When the body could reach a sign boundary inside a gap (it moves at most
+    `max_motion` degrees per row), the gap is computed exactly instead, so signs
+    derived from the result are always exact; interpolated longitudes are not.
+    """
+    longitudes = array('d', [0.0]) * n_points
+    if n_points == 0:
+        return longitudes
+
+    start, start_lon = 0, calc(0)
+    longitudes[0] = start_lon
+    while start < n_points - 1:
+        end = min(start + stride, n_points - 1)
+        end_lon = calc(end)
+        longitudes[end] = end_lon
+        span = end - start
+        margin = max_motion * span
+        if _distance_to_sign_boundary(start_lon) > margin or _distance_to_sign_boundary(end_lon) > margin:
+            delta = (end_lon - start_lon + 180.0) % 360.0 - 180.0
+            for offset in range(1, span):
+                longitudes[start + offset] = (start_lon + delta * offset / span) % 360.0
+        else:
+            for offset in range(1, span):
+                longitudes[start + offset] = calc(start + offset)
+        start, start_lon = end, end_lon
+    return longitudes
+
+
+def _distance_to_sign_boundary(longitude: float) -> float:
+    within_sign = longitude % 30.0
+    return min(within_sign, 30.0 - within_sign)
@@ -1,8 +1,16 @@
 """Kerykeion astrology provider implementation."""
 
-from collections import defaultdict
-from datetime import UTC, date, datetime, time
-
+from array import array
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from pathlib import Path
+from typing import NamedTuple
+from zoneinfo import ZoneInfo
+
+import kerykeion
+import swisseph as swe
 from kerykeion import (
     AspectsFactory,
     AstrologicalSubjectFactory,
@@ -10,11 +18,11 @@ from kerykeion import (
     RelationshipScoreFactory,
     TransitsTimeRangeFactory,
 )
-from kerykeion.schemas.kr_models import AstrologicalSubjectModel
 
 from app.config.astrology_presets import AstrologyConfig
 from app.core.exceptions import ChartCalculationException, InvalidBirthDataException
 from app.core.extractors import extract_celestial_objects, filter_aspects_by_orb, filter_personal_synastry_aspects
+from app.core.lru import lru_get, lru_put
 from app.core.temporal import normalize_transit_for_chart_timezone
 from app.domain.models import (
     BirthData,
@@ -26,6 +34,11 @@ from app.domain.models import (
     TransitPeriodResult,
 )
 from app.domain.ports import IAstrologyProvider
+from app.domain.zodiac import ZODIAC_SIGNS
+from app.infrastructure.providers._ephemeris_kernels import (
+    longitudes_to_signs,
+    strided_longitudes,
+)
 
 # Planets to track for transit periods (skip Moon - too fast, creates noise)
 TRANSIT_PLANETS = ['Sun', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto']
@@ -64,6 +77,111 @@ ASPECT_WEIGHT = {
     'conjunction': 10, 'opposition': 9, 'square': 8, 'trine': 5, 'sextile': 4
 }
 
+# Bodies sampled by generate_ephemeris_for_range (attribute name -> Swiss Ephemeris id)
+EPHEMERIS_BODIES = {
+    'sun': swe.SUN,
+    'moon': swe.MOON,
+    'venus': swe.VENUS,
+    'mars': swe.MARS,
+    'true_north_lunar_node': swe.TRUE_NODE,
+}
+# Slow bodies sampled every N days and linearly interpolated in between:
+# name -> (stride in days, max |daily motion| in degrees). Signs stay exact
+# (gaps that could cross a sign are computed fully) as long as the motion bound
+# holds; the True Node peaks at ~0.26 deg/day over 1900-2100.
+EPHEMERIS_INTERPOLATED_BODIES = {
+    'true_north_lunar_node': (10, 0.3),
+}
+# The True Node wobbles, so its interpolated longitude can be off by up to this many degrees
+EPHEMERIS_INTERPOLATION_MAX_ERROR = 0.5
+EPHEMERIS_MAX_DAYS = 15000  # ~40 years
+
+# Same ephemeris files Kerykeion uses; speeds are not needed, so FLG_SPEED is left off (~2x faster)
+_SWEPH_PATH = str(Path(kerykeion.__file__).parent / 'sweph')
+_SWEPH_FLAGS = swe.FLG_SWIEPH
+
+# Natal charts memoized per provider instance (least recently used evicted first).
+# A cached chart keeps its Kerykeion subject (~78 KB), so the bound covers a handful of
+# people requested back to back rather than a whole user base (~2.5 MB per process).
+NATAL_CHART_CACHE_SIZE = 32
+
+
+class EphemerisBody(NamedTuple):
+    """Position of one body on one ephemeris day (field names mirror Kerykeion points).
+
+    sign and sign_num are always exact. For bodies in EPHEMERIS_INTERPOLATED_BODIES
+    (the True Node), abs_pos and position are interpolated between samples on most
+    days and can differ from a full calculation by up to
+    EPHEMERIS_INTERPOLATION_MAX_ERROR degrees.
+    """
+
+    name: str
+    sign: str
+    sign_num: int
+    position: float
+    abs_pos: float
+
+
+class EphemerisPoint(NamedTuple):
+    """One ephemeris day: the date plus a position for each of EPHEMERIS_BODIES."""
+
+    year: int
+    month: int
+    day: int
+    sun: EphemerisBody
+    moon: EphemerisBody
+    venus: EphemerisBody
+    mars: EphemerisBody
+    true_north_lunar_node: EphemerisBody
+
+
+@dataclass
+class EphemerisTable(Sequence[EphemerisPoint]):
+    """
+    Columnar ephemeris: one date per row plus per-body longitude and sign-index columns.
+
+    Rows are materialized as EphemerisPoint only when indexed or iterated, so callers
+    that scan a body directly (e.g. table.longitudes['sun']) never build row objects.
+    """
+
+    dates: list[date]
+    # body name -> array('d') of ecliptic longitudes (approximate for EPHEMERIS_INTERPOLATED_BODIES)
+    longitudes: dict[str, array]
+    signs: dict[str, array]  # body name -> array('b') of sign indices into ZODIAC_SIGNS
+
+    @classmethod
+    def empty(cls) -> "EphemerisTable":
+        """Table with no rows (but every body column present)."""
+        return cls(
+            dates=[],
+            longitudes={name: array('d') for name in EPHEMERIS_BODIES},
+            signs={name: array('b') for name in EPHEMERIS_BODIES},
+        )
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, index: int | slice) -> EphemerisPoint | list[EphemerisPoint]:
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(len(self.dates)))]
+        if index < 0:
+            index += len(self.dates)
+        if not 0 <= index < len(self.dates):
+            raise IndexError("ephemeris index out of range")
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[EphemerisPoint]:
+        return map(self.row, range(len(self.dates)))
+
+    def row(self, index: int) -> EphemerisPoint:
+        """Materialize one row as an EphemerisPoint."""
+        day = self.dates[index]
+        bodies = {
+            name: _ephemeris_body(name, self.longitudes[name][index], self.signs[name][index])
+            for name in EPHEMERIS_BODIES
+        }
+        return EphemerisPoint(year=day.year, month=day.month, day=day.day, **bodies)
+
 
 class KerykeionProvider(IAstrologyProvider):
     """
@@ -81,11 +199,17 @@ class KerykeionProvider(IAstrologyProvider):
             config: Astrology configuration (planets, houses, orbs, etc.)
         """
         self.config = config
+        self._chart_cache: OrderedDict[tuple, NatalChart] = OrderedDict()
 
     def calculate_natal_chart(self, birth_data: BirthData) -> NatalChart:
         """
         Calculate a natal chart using Kerykeion.
 
+        Charts are memoized by birth data, so repeated requests for the same
+        person skip the Swiss Ephemeris calculation entirely. Throwaway charts
+        (e.g. soulmate search probes) should use calculate_natal_chart_uncached
+        so they do not evict real users.
+
         Args:
             birth_data: Birth information
 
@@ -96,6 +220,17 @@ class KerykeionProvider(IAstrologyProvider):
             InvalidBirthDataException: If birth data is invalid
             ChartCalculationException: If calculation fails
         """
+        key = birth_data.cache_key()
+        cached = lru_get(self._chart_cache, key)
+        if cached is not None:
+            return cached
+
+        natal_chart = self.calculate_natal_chart_uncached(birth_data)
+        lru_put(self._chart_cache, key, natal_chart, NATAL_CHART_CACHE_SIZE)
+        return natal_chart
+
+    def calculate_natal_chart_uncached(self, birth_data: BirthData) -> NatalChart:
+        """Calculate a natal chart without reading or populating the chart cache."""
         try:
             # Create Kerykeion astrological subject
             subject = AstrologicalSubjectFactory.from_birth_data(
@@ -466,43 +601,86 @@ class KerykeionProvider(IAstrologyProvider):
         end_date: date,
         location: BirthData,
         step_days: int = 1,
-    ) -> list[AstrologicalSubjectModel]:
+    ) -> EphemerisTable:
         """
-        Generate planetary positions for a date range using Kerykeion's EphemerisDataFactory.
+        Generate planetary positions for a date range directly from Swiss Ephemeris.
+
+        Only the bodies in EPHEMERIS_BODIES are computed, at local noon for each
+        date (slow bodies in EPHEMERIS_INTERPOLATED_BODIES only every few days).
+        Longitudes are stored per body in flat float arrays, and rows are only
+        materialized as EphemerisPoint tuples on access, so no per-day chart
+        (houses, aspects, full point models) is ever built.
 
-        This is much faster than calculating individual charts for each day,
-        as it uses ephemeris data directly (~100x faster for multi-year ranges).
+        Interpolated bodies (the True Node) get exact signs, but their abs_pos and
+        position are approximate, off by up to EPHEMERIS_INTERPOLATION_MAX_ERROR
+        degrees between samples. Use a full natal chart where the node's exact
+        degree matters.
 
         Args:
             start_date: Start of the date range
-            end_date: End of the date range
-            location: Reference location for calculations (lat/lng/timezone)
+            end_date: End of the date range (inclusive)
+            location: Reference location for calculations (timezone defines local noon)
             step_days: Days between ephemeris points (1=daily, 7=weekly for faster soulmate search)
 
         Returns:
-            List of AstrologicalSubjectModel objects with planetary positions
+            EphemerisTable; each row is an EphemerisPoint with year/month/day and one
+            EphemerisBody per body (e.g. point.sun.sign == "Ari", point.sun.abs_pos == 15.2)
 
         Raises:
             ChartCalculationException: If ephemeris calculation fails
         """
         try:
-            # Convert dates to datetime at noon
-            start_dt = datetime.combine(start_date, time(12, 0))
-            end_dt = datetime.combine(end_date, time(12, 0))
-
-            # Use EphemerisDataFactory for fast bulk calculation
-            ephemeris = EphemerisDataFactory(
-                start_datetime=start_dt,
-                end_datetime=end_dt,
-                lng=location.longitude,
-                lat=location.latitude,
-                tz_str=location.timezone,
-                step_type='days',
-                step=step_days,
-                max_days=15000,  # Allow up to ~40 years
-            )
-
-            return ephemeris.get_ephemeris_data_as_astrological_subjects()
+            n_points = (end_date - start_date).days // step_days + 1
+            if n_points <= 0:
+                raise ValueError("No dates found. Check the date range and step values.")
+            if n_points > EPHEMERIS_MAX_DAYS:
+                raise ValueError(f"Too many days: {n_points} > {EPHEMERIS_MAX_DAYS}")
+
+            zone = ZoneInfo(location.timezone)
+            days = [start_date + timedelta(days=i * step_days) for i in range(n_points)]
+            julian_days = array('d')
+            for day in days:
+                noon_utc = datetime.combine(day, time(12, 0), tzinfo=zone).astimezone(UTC)
+                # Whole minutes on purpose: Kerykeion resolves zones through pytz, which rounds
+                # LMT offsets (e.g. New York's -4:56:02) to the minute, so its subjects and
+                # EphemerisDataFactory sample at 16:56:00 UTC, not 16:56:02
+                julian_days.append(
+                    swe.julday(noon_utc.year, noon_utc.month, noon_utc.day, noon_utc.hour + noon_utc.minute / 60)
+                )
+
+            # Day-major loop: Swiss Ephemeris reuses per-date work (nutation, Earth) across bodies
+            swe.set_ephe_path(_SWEPH_PATH)
+            daily_bodies = {
+                name: body_id
+                for name, body_id in EPHEMERIS_BODIES.items()
+                if name not in EPHEMERIS_INTERPOLATED_BODIES
+            }
+            longitudes = {name: array('d') for name in daily_bodies}
+            for jd in julian_days:
+                for name, body_id in daily_bodies.items():
+                    longitudes[name].append(swe.calc_ut(jd, body_id, _SWEPH_FLAGS)[0][0])
+            for name, (stride_days, max_daily_motion) in EPHEMERIS_INTERPOLATED_BODIES.items():
+                body_id = EPHEMERIS_BODIES[name]
+                longitudes[name] = strided_longitudes(
+                    lambda row, body_id=body_id: swe.calc_ut(julian_days[row], body_id, _SWEPH_FLAGS)[0][0],
+                    n_points,
+                    stride=max(1, stride_days // step_days),
+                    max_motion=max_daily_motion * step_days,
+                )
+            signs = {name: longitudes_to_signs(column) for name, column in longitudes.items()}
+
+            return EphemerisTable(dates=days, longitudes=longitudes, signs=signs)
 
         except Exception as e:
             raise ChartCalculationException(f"Failed to generate ephemeris: {str(e)}")
+
+
+def _ephemeris_body(name: str, abs_pos: float, sign_num: int) -> EphemerisBody:
+    """Build the EphemerisBody for one body on one ephemeris day."""
+    return EphemerisBody(
+        name=name.title(),
+        sign=ZODIAC_SIGNS[sign_num],
+        sign_num=sign_num,
+        position=abs_pos % 30,
+        abs_pos=abs_pos,
+    )
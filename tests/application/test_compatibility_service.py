@@ -7,6 +7,8 @@ from app.config.astrology_presets import DEFAULT_CONFIG
 from app.domain.models import BirthData
 from app.infrastructure.providers.kerykeion_provider import KerykeionProvider
 
+pytestmark = [pytest.mark.slow, pytest.mark.usefixtures("_warm_ephemeris")]
+
 
 class TestSynastryServiceRelationshipScore:
     """Tests for SynastryService returning relationship_score in dict."""
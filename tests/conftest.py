@@ -0,0 +1,104 @@
+"""Shared pytest fixtures for the astrology service test suite.
+
+Tests that run real Kerykeion chart, synastry or soulmate calculations are marked
+``slow``; ``pytest -m "not slow"`` runs just the fast unit tests. The slow tests
+are independent, so with pytest-xdist installed they can be spread across
+cores with ``pytest -n auto --dist loadfile``; loadfile keeps each module on one
+worker so the session fixtures below are built once per worker. Modules whose
+tests share a response cache are also tagged with ``xdist_group`` so
+``--dist loadgroup`` keeps them together too.
+"""
+
+import functools
+from collections.abc import Callable, Iterator
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.application.soulmate_service import SoulmateService
+from app.config.astrology_presets import DEFAULT_CONFIG
+from app.domain.models import BirthData, NatalChart
+from app.infrastructure.providers.kerykeion_provider import KerykeionProvider
+from app.models.soulmate import SoulmateChartResponse
+
+# Canonical pair of subjects used by provider-level tests
+PERSON1_BIRTH_DATA = BirthData(
+    year=1990,
+    month=3,
+    day=15,
+    hour=14,
+    minute=30,
+    latitude=40.7128,
+    longitude=-74.0060,
+    timezone="America/New_York",
+)
+PERSON2_BIRTH_DATA = BirthData(
+    year=1992,
+    month=7,
+    day=22,
+    hour=10,
+    minute=15,
+    latitude=34.0522,
+    longitude=-118.2437,
+    timezone="America/Los_Angeles",
+)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "slow: runs real Kerykeion chart calculations")
+    # Registered by pytest-xdist when installed; declared here so plain runs accept it too
+    config.addinivalue_line("markers", "xdist_group(name): keep tests on one xdist worker under --dist loadgroup")
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """TestClient shared by the whole test session; app startup/shutdown runs once."""
+    # Imported here so unit-only runs never build the app or initialize Sentry
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def current_year() -> int:
+    """Current year, read once so a session spanning New Year stays consistent."""
+    return datetime.now().year
+
+
+@pytest.fixture(scope="session")
+def provider() -> KerykeionProvider:
+    """KerykeionProvider shared by the whole test session."""
+    return KerykeionProvider(config=DEFAULT_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def _warm_ephemeris(provider: KerykeionProvider) -> None:
+    """Load the Swiss Ephemeris files once up front so the first chart test doesn't pay the cold start.
+
+    Not autouse: slow modules opt in with ``pytest.mark.usefixtures("_warm_ephemeris")``
+    so fast unit runs never build a chart.
+    """
+    provider.calculate_natal_chart(PERSON1_BIRTH_DATA)
+
+
+@pytest.fixture(scope="session")
+def soulmate_service(provider: KerykeionProvider) -> SoulmateService:
+    """SoulmateService over the shared provider, so user natal charts hit its chart cache."""
+    return SoulmateService(provider=provider)
+
+
+@pytest.fixture(scope="session")
+def soulmate_chart(soulmate_service: SoulmateService) -> Callable[[BirthData], SoulmateChartResponse]:
+    """generate_soulmate_chart memoized per (frozen, hashable) BirthData for the whole session."""
+    return functools.lru_cache(maxsize=64)(soulmate_service.generate_soulmate_chart)
+
+
+@pytest.fixture(scope="session")
+def canonical_charts(provider: KerykeionProvider) -> tuple[NatalChart, NatalChart]:
+    """Natal charts for the canonical person1/person2 pair, computed once per session."""
+    return (
+        provider.calculate_natal_chart(PERSON1_BIRTH_DATA),
+        provider.calculate_natal_chart(PERSON2_BIRTH_DATA),
+    )
@@ -1,7 +1,11 @@
 """Tests for llm_formatter synastry formatting with relationship score."""
 
+import re
+
 from app.core.llm_formatter import _score_to_percentage, format_synastry
 
+_SCORE_BEFORE_ASPECTS = re.compile(r"COMPATIBILITY:.*?SYNASTRY ASPECTS", re.DOTALL)
+
 
 class TestScoreToPercentage:
     """Tests for _score_to_percentage using the Kerykeion sqrt curve."""
@@ -137,10 +141,7 @@ class TestFormatSynastryWithScore:
 
         result = format_synastry(synastry_data)
 
-        score_pos = result.find("COMPATIBILITY")
-        aspects_pos = result.find("SYNASTRY ASPECTS")
-
-        assert score_pos < aspects_pos, "COMPATIBILITY should appear before SYNASTRY ASPECTS"
+        assert _SCORE_BEFORE_ASPECTS.search(result), "COMPATIBILITY should appear before SYNASTRY ASPECTS"
 
     def test_format_synastry_high_score_shows_high_percentage(self):
         """High score (24) shows 89% (sqrt curve)."""
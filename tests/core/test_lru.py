@@ -0,0 +1,20 @@
+"""Tests for the shared OrderedDict LRU helpers."""
+
+from collections import OrderedDict
+
+from app.core.lru import lru_get, lru_put
+
+
+def test_lru_put_evicts_least_recently_used():
+    cache: OrderedDict[str, int] = OrderedDict()
+    lru_put(cache, "a", 1, max_size=2)
+    lru_put(cache, "b", 2, max_size=2)
+
+    assert lru_get(cache, "a") == 1  # "a" becomes most recently used
+    lru_put(cache, "c", 3, max_size=2)
+
+    assert list(cache) == ["a", "c"]
+
+
+def test_lru_get_miss_returns_none():
+    assert lru_get(OrderedDict(), "missing") is None
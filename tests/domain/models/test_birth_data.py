@@ -0,0 +1,22 @@
+"""Tests for the BirthData value object."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.domain.models.birth_data import BirthData
+
+
+def test_birth_data_is_immutable():
+    birth_data = BirthData(year=1990, month=3, day=15)
+
+    with pytest.raises(ValidationError):
+        birth_data.year = 1991
+
+
+def test_equal_birth_data_hash_equal():
+    first = BirthData(year=1990, month=3, day=15, timezone="America/New_York")
+    second = BirthData(year=1990, month=3, day=15, timezone="America/New_York")
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert hash(first.cache_key()) == hash(second.cache_key())
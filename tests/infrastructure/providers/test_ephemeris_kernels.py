@@ -0,0 +1,41 @@
+"""Tests for the ephemeris column kernels."""
+
+import math
+from array import array
+
+from app.infrastructure.providers._ephemeris_kernels import (
+    longitudes_to_signs,
+    strided_longitudes,
+)
+
+
+def test_longitudes_to_signs_maps_each_30_degree_band():
+    lons = array('d', [0.0, 29.999, 30.0, 195.5, 359.99])
+
+    assert list(longitudes_to_signs(lons)) == [0, 0, 1, 6, 11]
+
+
+def test_longitudes_to_signs_wraps_360_to_aries():
+    assert list(longitudes_to_signs(array('d', [360.0]))) == [0]
+
+
+def test_longitudes_to_signs_empty_column():
+    assert len(longitudes_to_signs(array('d'))) == 0
+
+
+def test_strided_longitudes_keeps_signs_exact_for_wobbling_body():
+    # Retrograde drift with a wobble, crossing several sign boundaries
+    def exact(row: int) -> float:
+        return (100.0 - 0.05 * row + 0.5 * math.sin(row / 2.2)) % 360.0
+
+    calls = []
+    strided = strided_longitudes(lambda row: calls.append(row) or exact(row), 2000, stride=10, max_motion=0.3)
+    reference = array('d', [exact(row) for row in range(2000)])
+
+    assert list(longitudes_to_signs(strided)) == list(longitudes_to_signs(reference))
+    assert len(calls) < 2000 // 2
+
+
+def test_strided_longitudes_short_and_empty_ranges():
+    assert list(strided_longitudes(lambda row: 10.0 * row, 3, stride=10, max_motion=1.0)) == [0.0, 10.0, 20.0]
+    assert len(strided_longitudes(lambda row: 0.0, 0, stride=10, max_motion=1.0)) == 0
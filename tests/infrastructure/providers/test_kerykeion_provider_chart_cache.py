@@ -0,0 +1,59 @@
+"""Tests for KerykeionProvider natal chart memoization."""
+
+import pytest
+
+from app.config.astrology_presets import DEFAULT_CONFIG
+from app.domain.models import BirthData
+from app.infrastructure.providers.kerykeion_provider import KerykeionProvider
+from app.models.requests import ProfileRequest
+
+
+def _birth_data() -> BirthData:
+    return BirthData(
+        year=1990,
+        month=3,
+        day=15,
+        hour=14,
+        minute=30,
+        latitude=40.7128,
+        longitude=-74.0060,
+        timezone="America/New_York",
+    )
+
+
+def test_calculate_natal_chart_computes_once_per_birth_data(monkeypatch):
+    provider = KerykeionProvider(config=DEFAULT_CONFIG)
+    calls = []
+    monkeypatch.setattr(provider, "calculate_natal_chart_uncached", lambda birth_data: calls.append(birth_data) or object())
+
+    first = provider.calculate_natal_chart(_birth_data())
+    second = provider.calculate_natal_chart(_birth_data())
+
+    assert first is second
+    assert len(calls) == 1
+
+
+def test_calculate_natal_chart_cache_ignores_request_only_fields(monkeypatch):
+    provider = KerykeionProvider(config=DEFAULT_CONFIG)
+    calls = []
+    monkeypatch.setattr(provider, "calculate_natal_chart_uncached", lambda birth_data: calls.append(birth_data) or object())
+
+    provider.calculate_natal_chart(_birth_data())
+    provider.calculate_natal_chart(
+        ProfileRequest(**_birth_data().model_dump(), transit_date="2025-10-30T12:00:00Z")
+    )
+
+    assert len(calls) == 1
+
+
+@pytest.mark.slow
+@pytest.mark.usefixtures("_warm_ephemeris")
+def test_calculate_natal_chart_uncached_neither_reads_nor_stores():
+    provider = KerykeionProvider(config=DEFAULT_CONFIG)
+    provider.calculate_natal_chart(_birth_data())
+
+    first = provider.calculate_natal_chart_uncached(_birth_data())
+    second = provider.calculate_natal_chart_uncached(_birth_data())
+
+    assert first is not second
+    assert len(provider._chart_cache) == 1
@@ -2,53 +2,20 @@
 
 import pytest
 
-from app.config.astrology_presets import DEFAULT_CONFIG
-from app.domain.models import BirthData
+from app.domain.models import NatalChart
 from app.infrastructure.providers.kerykeion_provider import KerykeionProvider
 
+pytestmark = [pytest.mark.slow, pytest.mark.usefixtures("_warm_ephemeris")]
+
 
 class TestKerykeionProviderSynastryScore:
     """Tests for calculate_synastry returning relationship_score."""
 
-    @pytest.fixture
-    def provider(self) -> KerykeionProvider:
-        """Create a KerykeionProvider instance."""
-        return KerykeionProvider(config=DEFAULT_CONFIG)
-
-    @pytest.fixture
-    def person1_data(self) -> BirthData:
-        """Birth data for person 1."""
-        return BirthData(
-            year=1990,
-            month=3,
-            day=15,
-            hour=14,
-            minute=30,
-            latitude=40.7128,
-            longitude=-74.0060,
-            timezone="America/New_York",
-        )
-
-    @pytest.fixture
-    def person2_data(self) -> BirthData:
-        """Birth data for person 2."""
-        return BirthData(
-            year=1992,
-            month=7,
-            day=22,
-            hour=10,
-            minute=15,
-            latitude=34.0522,
-            longitude=-118.2437,
-            timezone="America/Los_Angeles",
-        )
-
     def test_calculate_synastry_returns_relationship_score(
-        self, provider: KerykeionProvider, person1_data: BirthData, person2_data: BirthData
+        self, provider: KerykeionProvider, canonical_charts: tuple[NatalChart, NatalChart]
     ):
         """calculate_synastry returns synastry with relationship_score."""
-        chart1 = provider.calculate_natal_chart(person1_data)
-        chart2 = provider.calculate_natal_chart(person2_data)
+        chart1, chart2 = canonical_charts
 
         synastry = provider.calculate_synastry(chart1, chart2)
 
@@ -57,33 +24,30 @@ class TestKerykeionProviderSynastryScore:
         assert hasattr(synastry.relationship_score, "is_destiny_sign")
 
     def test_relationship_score_value_is_int(
-        self, provider: KerykeionProvider, person1_data: BirthData, person2_data: BirthData
+        self, provider: KerykeionProvider, canonical_charts: tuple[NatalChart, NatalChart]
     ):
         """relationship_score.score_value is an integer."""
-        chart1 = provider.calculate_natal_chart(person1_data)
-        chart2 = provider.calculate_natal_chart(person2_data)
+        chart1, chart2 = canonical_charts
 
         synastry = provider.calculate_synastry(chart1, chart2)
 
         assert isinstance(synastry.relationship_score.score_value, int)
 
     def test_relationship_score_is_destiny_sign_is_bool(
-        self, provider: KerykeionProvider, person1_data: BirthData, person2_data: BirthData
+        self, provider: KerykeionProvider, canonical_charts: tuple[NatalChart, NatalChart]
     ):
         """relationship_score.is_destiny_sign is a boolean."""
-        chart1 = provider.calculate_natal_chart(person1_data)
-        chart2 = provider.calculate_natal_chart(person2_data)
+        chart1, chart2 = canonical_charts
 
         synastry = provider.calculate_synastry(chart1, chart2)
 
         assert isinstance(synastry.relationship_score.is_destiny_sign, bool)
 
     def test_calculate_synastry_still_returns_aspects(
-        self, provider: KerykeionProvider, person1_data: BirthData, person2_data: BirthData
+        self, provider: KerykeionProvider, canonical_charts: tuple[NatalChart, NatalChart]
     ):
         """calculate_synastry maintains aspects alongside relationship_score."""
-        chart1 = provider.calculate_natal_chart(person1_data)
-        chart2 = provider.calculate_natal_chart(person2_data)
+        chart1, chart2 = canonical_charts
 
         synastry = provider.calculate_synastry(chart1, chart2)
 
@@ -1,57 +1,57 @@
-"""Tests for ephemeris-based derivation using EphemerisDataFactory.
+"""Tests for ephemeris generation in KerykeionProvider.
 
-TDD approach: these tests are written first and will fail until implementation is complete.
+generate_ephemeris_for_range returns a columnar EphemerisTable. These tests check
+that its lazily built rows agree with the body columns, and compare its positions
+against full Kerykeion subjects from EphemerisDataFactory (the golden check),
+including the interpolated True Node.
 
 Run tests:
-    pytest astrology-service/tests/test_ephemeris_generation.py -v
+    pytest tests/test_ephemeris_generation.py -v
 """
 
-from datetime import date
+import time
+from collections.abc import Sequence
+from datetime import date, datetime
 
 import pytest
+import swisseph as swe
+from kerykeion import EphemerisDataFactory
 
+from app.domain.models import BirthData
+from app.infrastructure.providers import kerykeion_provider
+from app.infrastructure.providers.kerykeion_provider import (
+    EPHEMERIS_BODIES,
+    EPHEMERIS_INTERPOLATED_BODIES,
+    EPHEMERIS_INTERPOLATION_MAX_ERROR,
+)
 
-class TestEphemerisGeneration:
-    """Tests for ephemeris generation method in KerykeionProvider."""
 
-    def test_generate_ephemeris_for_range_returns_list(self):
-        """Should return list of AstrologicalSubject objects."""
-        from app.config.astrology_presets import DetailLevel, get_preset
-        from app.domain.models import BirthData
-        from app.infrastructure.providers.kerykeion_provider import KerykeionProvider
+@pytest.fixture(scope="module")
+def location():
+    """Reference location shared by the ephemeris tests (provider comes from conftest)."""
+    return BirthData(
+        year=1990, month=1, day=1, hour=12, minute=0,
+        latitude=40.7, longitude=-74.0, timezone="America/New_York"
+    )
 
-        config = get_preset(DetailLevel.CORE)
-        provider = KerykeionProvider(config=config)
 
-        location = BirthData(
-            year=1990, month=1, day=1, hour=12, minute=0,
-            latitude=40.7, longitude=-74.0, timezone="America/New_York"
-        )
+class TestEphemerisGeneration:
+    """Tests for ephemeris generation method in KerykeionProvider."""
 
+    def test_generate_ephemeris_for_range_returns_sequence(self, provider, location):
+        """Should return a sequence of ephemeris points."""
         result = provider.generate_ephemeris_for_range(
             start_date=date(2000, 1, 1),
             end_date=date(2000, 12, 31),
             location=location
         )
 
-        assert isinstance(result, list)
+        assert isinstance(result, Sequence)
         # Should have ~365 daily positions (2000 is not a leap year for this purpose)
         assert len(result) >= 360
 
-    def test_generate_ephemeris_for_range_leap_year(self):
+    def test_generate_ephemeris_for_range_leap_year(self, provider, location):
         """Should handle leap year correctly (366 days)."""
-        from app.config.astrology_presets import DetailLevel, get_preset
-        from app.domain.models import BirthData
-        from app.infrastructure.providers.kerykeion_provider import KerykeionProvider
-
-        config = get_preset(DetailLevel.CORE)
-        provider = KerykeionProvider(config=config)
-
-        location = BirthData(
-            year=1990, month=1, day=1, hour=12, minute=0,
-            latitude=40.7, longitude=-74.0, timezone="America/New_York"
-        )
-
         # 2000 is a leap year
         result = provider.generate_ephemeris_for_range(
             start_date=date(2000, 1, 1),
@@ -59,24 +59,12 @@ class TestEphemerisGeneration:
             location=location
         )
 
-        assert isinstance(result, list)
+        assert isinstance(result, Sequence)
         # Should have 366 daily positions (leap year) plus 1 for Jan 1 2001
         assert len(result) >= 366
 
-    def test_ephemeris_points_have_sun_sign(self):
+    def test_ephemeris_points_have_sun_sign(self, provider, location):
         """Each ephemeris point should have sun.sign attribute."""
-        from app.config.astrology_presets import DetailLevel, get_preset
-        from app.domain.models import BirthData
-        from app.infrastructure.providers.kerykeion_provider import KerykeionProvider
-
-        config = get_preset(DetailLevel.CORE)
-        provider = KerykeionProvider(config=config)
-
-        location = BirthData(
-            year=1990, month=1, day=1, hour=12, minute=0,
-            latitude=40.7, longitude=-74.0, timezone="America/New_York"
-        )
-
         result = provider.generate_ephemeris_for_range(
             start_date=date(2000, 1, 1),
             end_date=date(2000, 1, 31),
@@ -88,20 +76,8 @@ class TestEphemerisGeneration:
             assert hasattr(point, 'sun')
             assert hasattr(point.sun, 'sign')
 
-    def test_ephemeris_points_have_moon_sign(self):
+    def test_ephemeris_points_have_moon_sign(self, provider, location):
         """Each ephemeris point should have moon.sign attribute."""
-        from app.config.astrology_presets import DetailLevel, get_preset
-        from app.domain.models import BirthData
-        from app.infrastructure.providers.kerykeion_provider import KerykeionProvider
-
-        config = get_preset(DetailLevel.CORE)
-        provider = KerykeionProvider(config=config)
-
-        location = BirthData(
-            year=1990, month=1, day=1, hour=12, minute=0,
-            latitude=40.7, longitude=-74.0, timezone="America/New_York"
-        )
-
         result = provider.generate_ephemeris_for_range(
             start_date=date(2000, 1, 1),
             end_date=date(2000, 1, 31),
@@ -113,20 +89,8 @@ class TestEphemerisGeneration:
             assert hasattr(point, 'moon')
             assert hasattr(point.moon, 'sign')
 
-    def test_ephemeris_points_have_venus_sign(self):
+    def test_ephemeris_points_have_venus_sign(self, provider, location):
         """Each ephemeris point should have venus.sign attribute."""
-        from app.config.astrology_presets import DetailLevel, get_preset
-        from app.domain.models import BirthData
-        from app.infrastructure.providers.kerykeion_provider import KerykeionProvider
-
-        config = get_preset(DetailLevel.CORE)
-        provider = KerykeionProvider(config=config)
-
-        location = BirthData(
-            year=1990, month=1, day=1, hour=12, minute=0,
-            latitude=40.7, longitude=-74.0, timezone="America/New_York"
-        )
-
         result = provider.generate_ephemeris_for_range(
             start_date=date(2000, 1, 1),
             end_date=date(2000, 1, 31),
@@ -138,20 +102,8 @@ class TestEphemerisGeneration:
             assert hasattr(point, 'venus')
             assert hasattr(point.venus, 'sign')
 
-    def test_ephemeris_points_have_mars_sign(self):
+    def test_ephemeris_points_have_mars_sign(self, provider, location):
         """Each ephemeris point should have mars.sign attribute."""
-        from app.config.astrology_presets import DetailLevel, get_preset
-        from app.domain.models import BirthData
-        from app.infrastructure.providers.kerykeion_provider import KerykeionProvider
-
-        config = get_preset(DetailLevel.CORE)
-        provider = KerykeionProvider(config=config)
-
-        location = BirthData(
-            year=1990, month=1, day=1, hour=12, minute=0,
-            latitude=40.7, longitude=-74.0, timezone="America/New_York"
-        )
-
         result = provider.generate_ephemeris_for_range(
             start_date=date(2000, 1, 1),
             end_date=date(2000, 1, 31),
@@ -163,20 +115,8 @@ class TestEphemerisGeneration:
             assert hasattr(point, 'mars')
             assert hasattr(point.mars, 'sign')
 
-    def test_ephemeris_points_have_north_node(self):
+    def test_ephemeris_points_have_north_node(self, provider, location):
         """Each ephemeris point should have true_north_lunar_node (True Node)."""
-        from app.config.astrology_presets import DetailLevel, get_preset
-        from app.domain.models import BirthData
-        from app.infrastructure.providers.kerykeion_provider import KerykeionProvider
-
-        config = get_preset(DetailLevel.CORE)
-        provider = KerykeionProvider(config=config)
-
-        location = BirthData(
-            year=1990, month=1, day=1, hour=12, minute=0,
-            latitude=40.7, longitude=-74.0, timezone="America/New_York"
-        )
-
         result = provider.generate_ephemeris_for_range(
             start_date=date(2000, 1, 1),
             end_date=date(2000, 1, 31),
@@ -190,22 +130,8 @@ class TestEphemerisGeneration:
             assert hasattr(point.true_north_lunar_node, 'sign')
 
     @pytest.mark.skip(reason="Performance test for internal reference only")
-    def test_ephemeris_performance_large_range(self):
+    def test_ephemeris_performance_large_range(self, provider, location):
         """Should handle 14-year range efficiently (for soulmate search)."""
-        import time
-
-        from app.config.astrology_presets import DetailLevel, get_preset
-        from app.domain.models import BirthData
-        from app.infrastructure.providers.kerykeion_provider import KerykeionProvider
-
-        config = get_preset(DetailLevel.CORE)
-        provider = KerykeionProvider(config=config)
-
-        location = BirthData(
-            year=1990, month=1, day=1, hour=12, minute=0,
-            latitude=40.7, longitude=-74.0, timezone="America/New_York"
-        )
-
         start_time = time.time()
         result = provider.generate_ephemeris_for_range(
             start_date=date(2000, 1, 1),
@@ -218,3 +144,88 @@ class TestEphemerisGeneration:
         assert len(result) >= 5000
         # Should complete in under 10 seconds (much faster than 56 chart calculations)
         assert elapsed < 10.0, f"Ephemeris generation took {elapsed:.2f}s, expected < 10s"
+
+    def test_ephemeris_rows_match_columns(self, provider, location):
+        """Indexing, slicing and iteration all materialize the same rows as the columns."""
+        result = provider.generate_ephemeris_for_range(
+            start_date=date(2000, 1, 1),
+            end_date=date(2000, 1, 31),
+            location=location
+        )
+
+        assert len(result) == 31
+        assert result[-1] == result[30] == list(result)[30]
+        assert result[:3] == [result[0], result[1], result[2]]
+        assert (result[30].year, result[30].month, result[30].day) == (2000, 1, 31)
+        assert result[30].sun.abs_pos == result.longitudes["sun"][30]
+        with pytest.raises(IndexError):
+            result[31]
+
+    @pytest.mark.slow
+    @pytest.mark.usefixtures("_warm_ephemeris")
+    @pytest.mark.parametrize("timezone,latitude,longitude,year", [
+        ("America/New_York", 40.7, -74.0, 2000),
+        ("Asia/Tokyo", 35.7, 139.7, 2000),
+        ("Australia/Sydney", -33.9, 151.2, 2000),
+        # Pre-1883 New York runs on LMT (UTC-4:56:02), so local noon falls on a non-zero UTC second
+        ("America/New_York", 40.7, -74.0, 1880),
+    ])
+    def test_ephemeris_matches_full_kerykeion_subjects(self, provider, timezone, latitude, longitude, year):
+        """Golden check: positions match a full AstrologicalSubject built for each date at local noon."""
+        location = BirthData(
+            year=1990, month=1, day=1, hour=12, minute=0,
+            latitude=latitude, longitude=longitude, timezone=timezone
+        )
+        start, end = date(year, 1, 1), date(year, 12, 31)
+
+        result = provider.generate_ephemeris_for_range(start_date=start, end_date=end, location=location, step_days=2)
+        reference = EphemerisDataFactory(
+            start_datetime=datetime(start.year, start.month, start.day, 12),
+            end_datetime=datetime(end.year, end.month, end.day, 12),
+            lng=longitude,
+            lat=latitude,
+            tz_str=timezone,
+            step_type="days",
+            step=2,
+        ).get_ephemeris_data_as_astrological_subjects()
+
+        assert len(result) == len(reference)
+        for point, subject in zip(result, reference):
+            assert (point.year, point.month, point.day) == (subject.year, subject.month, subject.day)
+            for body in EPHEMERIS_BODIES:
+                expected = getattr(subject, body)
+                # Interpolated slow bodies keep exact signs but only approximate longitudes
+                tolerance = EPHEMERIS_INTERPOLATION_MAX_ERROR if body in EPHEMERIS_INTERPOLATED_BODIES else 1e-9
+                assert getattr(point, body).sign == expected.sign
+                assert getattr(point, body).abs_pos == pytest.approx(expected.abs_pos, abs=tolerance)
+
+    @pytest.mark.slow
+    def test_interpolated_bodies_match_exact_daily_ephemeris(self, provider, location, monkeypatch):
+        """At the production step_days=1 over 2000-2005 (several node ingresses), interpolated
+        bodies keep exact signs and stay within EPHEMERIS_INTERPOLATION_MAX_ERROR degrees."""
+        start, end = date(2000, 1, 1), date(2005, 12, 31)
+        result = provider.generate_ephemeris_for_range(start_date=start, end_date=end, location=location)
+        monkeypatch.setattr(kerykeion_provider, "EPHEMERIS_INTERPOLATED_BODIES", {})
+        exact = provider.generate_ephemeris_for_range(start_date=start, end_date=end, location=location)
+
+        for body in EPHEMERIS_INTERPOLATED_BODIES:
+            # The span must actually cross sign boundaries for the check to mean anything
+            assert len(set(exact.signs[body])) >= 3
+            assert result.signs[body] == exact.signs[body]
+            for approx_lon, exact_lon in zip(result.longitudes[body], exact.longitudes[body]):
+                assert abs((approx_lon - exact_lon + 180.0) % 360.0 - 180.0) <= EPHEMERIS_INTERPOLATION_MAX_ERROR
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("body", sorted(EPHEMERIS_INTERPOLATED_BODIES))
+    def test_interpolated_body_motion_stays_within_bound(self, body):
+        """Swiss Ephemeris speeds over 1900-2100 never exceed the max daily motion sign exactness relies on."""
+        _, max_daily_motion = EPHEMERIS_INTERPOLATED_BODIES[body]
+        swe.set_ephe_path(kerykeion_provider._SWEPH_PATH)
+        start_jd = swe.julday(1900, 1, 1, 12.0)
+
+        fastest = max(
+            abs(swe.calc_ut(start_jd + day, EPHEMERIS_BODIES[body], swe.FLG_SWIEPH | swe.FLG_SPEED)[0][3])
+            for day in range(0, 365 * 200, 2)
+        )
+
+        assert fastest <= max_daily_motion
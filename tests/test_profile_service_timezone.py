@@ -3,13 +3,14 @@
 from datetime import UTC, date, datetime
 from types import SimpleNamespace
 
-from app.application.profile_service import ProfileService
+from app.application.profile_service import ProfileService, _month_last_day
 from app.domain.models import BirthData
 
 
 class FakeProvider:
     def __init__(self):
         self.last_transit_date = None
+        self.transit_calls = 0
         self.last_start_date = None
         self.last_end_date = None
 
@@ -25,6 +26,7 @@ class FakeProvider:
 
     def calculate_transits(self, natal_chart, transit_date):
         self.last_transit_date = transit_date
+        self.transit_calls += 1
         return SimpleNamespace(
             date=transit_date,
             planets={},
@@ -61,6 +63,54 @@ def test_generate_profile_defaults_to_birth_timezone_now():
     assert getattr(provider.last_transit_date.tzinfo, "key", None) == "America/New_York"
 
 
+def test_generate_profile_reuses_transits_within_default_now_bucket():
+    provider = FakeProvider()
+    # Buckets are 14-minute steps from the Unix epoch: 10:00 and 10:10 UTC both fall in 09:58-10:12
+    nows = iter([datetime(2026, 2, 3, 10, 0, tzinfo=UTC), datetime(2026, 2, 3, 10, 10, tzinfo=UTC)])
+
+    class SteppingNowProfileService(ProfileService):
+        @staticmethod
+        def _resolve_now_for_birth_timezone(birth_data: BirthData) -> datetime:
+            return next(nows)
+
+    service = SteppingNowProfileService(provider=provider)
+
+    first = service.generate_profile(_birth_data("Europe/London"))
+    second = service.generate_profile(_birth_data("Europe/London"))
+
+    assert provider.transit_calls == 1
+    assert provider.last_transit_date == datetime(2026, 2, 3, 9, 58, tzinfo=UTC)
+    assert first["transits"] == second["transits"]
+
+
+def test_generate_profile_does_not_cache_explicit_transit_date():
+    provider = FakeProvider()
+    service = ProfileService(provider=provider)
+    transit_date = datetime(2026, 2, 3, 10, 5, 37, tzinfo=UTC)
+
+    service.generate_profile(_birth_data("Europe/London"), transit_date)
+    service.generate_profile(_birth_data("Europe/London"), transit_date)
+
+    assert provider.transit_calls == 2
+    assert provider.last_transit_date == transit_date
+    assert len(service._transit_cache) == 0
+
+
+def test_generate_profile_reports_floored_default_transit_date():
+    provider = FakeProvider()
+
+    class FixedNowProfileService(ProfileService):
+        @staticmethod
+        def _resolve_now_for_birth_timezone(birth_data: BirthData) -> datetime:
+            return datetime(2026, 2, 3, 10, 5, 37, 120000, tzinfo=UTC)
+
+    service = FixedNowProfileService(provider=provider)
+
+    result = service.generate_profile(_birth_data("Europe/London"))
+
+    assert result["transits"]["date"] == "2026-02-03T09:58:00+00:00"
+
+
 def test_resolve_now_for_birth_timezone_falls_back_to_utc():
     resolved = ProfileService._resolve_now_for_birth_timezone(_birth_data("Invalid/Timezone"))
     assert resolved.tzinfo == UTC
@@ -89,3 +139,10 @@ def test_generate_monthly_profile_uses_birth_timezone_month(monkeypatch):
     assert result == "formatted-monthly-profile"
     assert provider.last_start_date == date(2026, 2, 1)
     assert provider.last_end_date == date(2026, 2, 28)
+
+
+def test_month_last_day_handles_leap_years():
+    assert _month_last_day(2028, 2) == 29
+    assert _month_last_day(2000, 2) == 29
+    assert _month_last_day(2100, 2) == 28
+    assert _month_last_day(2026, 12) == 31
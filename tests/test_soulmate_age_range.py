@@ -6,6 +6,8 @@ Run tests:
     pytest astrology-service/tests/test_soulmate_age_range.py -v
 """
 
+import pytest
+
 from app.application.soulmate_service import calculate_age_range
 
 
@@ -279,19 +281,18 @@ class TestEdgeCases:
         assert min_age == 18
         assert max_age == 26
 
-    def test_range_always_8_years(self):
+    @pytest.mark.parametrize("user_age,user_gender,soulmate_sex", [
+        (30, "male", "female"),
+        (30, "female", "male"),
+        (30, "male", "male"),
+        (30, "female", "female"),
+        (30, None, "female"),
+        (30, "male", None),
+    ])
+    def test_range_always_8_years(self, user_age, user_gender, soulmate_sex):
         """All gender combinations should produce an 8-year range."""
-        test_cases = [
-            (30, "male", "female"),
-            (30, "female", "male"),
-            (30, "male", "male"),
-            (30, "female", "female"),
-            (30, None, "female"),
-            (30, "male", None),
-        ]
-        for user_age, user_gender, soulmate_sex in test_cases:
-            min_age, max_age = calculate_age_range(user_age, user_gender, soulmate_sex)
-            assert max_age - min_age == 8, (
-                f"Range not 8 years for {user_gender} -> {soulmate_sex}: "
-                f"got {min_age}-{max_age} ({max_age - min_age} years)"
-            )
+        min_age, max_age = calculate_age_range(user_age, user_gender, soulmate_sex)
+        assert max_age - min_age == 8, (
+            f"Range not 8 years for {user_gender} -> {soulmate_sex}: "
+            f"got {min_age}-{max_age} ({max_age - min_age} years)"
+        )
@@ -28,8 +28,7 @@ from app.application.soulmate_service import (
     score_north_node_contacts,
     score_to_compatibility_percent,
 )
-from app.config.astrology_presets import DetailLevel, get_preset
-from app.domain.models import BirthData
+from app.domain.models import BirthData, NatalChart
 from app.infrastructure.providers.kerykeion_provider import KerykeionProvider
 
 # ============ Test User Profiles ============
@@ -98,18 +97,12 @@ def _create_birth_data(user: UserProfile) -> BirthData:
     )
 
 
-def _get_provider_and_service() -> tuple[KerykeionProvider, SoulmateService]:
-    """Create provider and service instances."""
-    config = get_preset(DetailLevel.CORE)
-    provider = KerykeionProvider(config)
-    service = SoulmateService(provider=provider)
-    return provider, service
-
-
 # ============ Test 1: End-to-End Compatibility ============
 # EXPECTED TO FAIL - documents that algorithm produces ~55-90%, not 95%+
 
 
+@pytest.mark.slow
+@pytest.mark.usefixtures("_warm_ephemeris")
 class TestEndToEndCompatibility:
     """Tests verifying final compatibility ≥95% for all test users.
 
@@ -120,7 +113,7 @@ class TestEndToEndCompatibility:
     """
 
     @pytest.mark.parametrize("user", TEST_USERS, ids=lambda u: u.name.replace(" ", "_"))
-    def test_final_compatibility_at_least_95_percent(self, user: UserProfile):
+    def test_final_compatibility_at_least_95_percent(self, soulmate_chart, user: UserProfile):
         """Final compatibility should be ≥95% for any user.
 
         This is the PRIMARY success criteria. If this test passes for all users,
@@ -128,10 +121,9 @@ class TestEndToEndCompatibility:
 
         EXPECTED TO FAIL - current implementation produces lower scores.
         """
-        _, service = _get_provider_and_service()
         birth_data = _create_birth_data(user)
 
-        result = service.generate_soulmate_chart(birth_data)
+        result = soulmate_chart(birth_data)
 
         print(f"\n{user.name}: {result.compatibility_percent}%")
 
@@ -139,14 +131,14 @@ class TestEndToEndCompatibility:
             f"{user.name} got {result.compatibility_percent}% compatibility, expected ≥95%"
         )
 
-    def test_deterministic_same_input_same_result(self):
+    def test_deterministic_same_input_same_result(self, soulmate_service: SoulmateService, soulmate_chart):
         """Same user should always get the same result (deterministic)."""
-        _, service = _get_provider_and_service()
         user = TEST_USERS[2]  # Gemini user
         birth_data = _create_birth_data(user)
 
-        result1 = service.generate_soulmate_chart(birth_data)
-        result2 = service.generate_soulmate_chart(birth_data)
+        # The first run is shared with the end-to-end test above; only the second is fresh work
+        result1 = soulmate_chart(birth_data)
+        result2 = soulmate_service.generate_soulmate_chart(birth_data)
 
         assert result1.compatibility_percent == result2.compatibility_percent
         assert result1.planets.get("sun", {}).get("sign") == result2.planets.get("sun", {}).get("sign")
@@ -296,59 +288,55 @@ class TestScoreNorthNodeContacts:
         assert score == 0
 
 
+@pytest.fixture(scope="module")
+def ascendant_lookup(
+    provider: KerykeionProvider, soulmate_service: SoulmateService
+) -> dict[str, tuple[int, int, NatalChart]]:
+    """Hour, minute and natal chart found for each target rising sign on 1995-06-15 in London, computed once."""
+    lookup = {}
+    for target_rising in ZODIAC_SIGNS:
+        target_hour, target_minute = soulmate_service._find_hour_for_ascendant(
+            1995, 6, 15, target_rising, 51.5, -0.1, "Europe/London"
+        )
+
+        birth = BirthData(
+            year=1995,
+            month=6,
+            day=15,
+            hour=target_hour,
+            minute=target_minute,
+            latitude=51.5,
+            longitude=-0.1,
+            timezone="Europe/London",
+        )
+        lookup[target_rising] = (target_hour, target_minute, provider.calculate_natal_chart(birth))
+    return lookup
+
+
+@pytest.mark.slow
+@pytest.mark.usefixtures("_warm_ephemeris")
 class TestFindHourForAscendant:
     """Tests for _find_hour_for_ascendant method."""
 
-    def test_produces_correct_ascendant_sign(self):
+    def test_produces_correct_ascendant_sign(self, ascendant_lookup):
         """Should find hour that produces the target Ascendant sign."""
-        provider, service = _get_provider_and_service()
-
         for target_rising in ZODIAC_SIGNS:
-            target_hour, target_minute = service._find_hour_for_ascendant(
-                1995, 6, 15, target_rising, 51.5, -0.1, "Europe/London"
-            )
-
-            birth = BirthData(
-                year=1995,
-                month=6,
-                day=15,
-                hour=target_hour,
-                minute=target_minute,
-                latitude=51.5,
-                longitude=-0.1,
-                timezone="Europe/London",
-            )
-            chart = provider.calculate_natal_chart(birth)
+            target_hour, target_minute, chart = ascendant_lookup[target_rising]
             actual_sign = chart.points.get("ascendant", {}).get("sign", "")
 
             assert actual_sign == target_rising, (
                 f"Target rising {target_rising}, got {actual_sign} at {target_hour}:{target_minute:02d}"
             )
 
-    def test_produces_ascendant_within_15_degrees_of_sign_center(self):
+    def test_produces_ascendant_within_15_degrees_of_sign_center(self, ascendant_lookup):
         """Ascendant should be within 15° of the target sign's center."""
-        provider, service = _get_provider_and_service()
         errors = []
 
         for target_rising in ZODIAC_SIGNS:
             sign_idx = ZODIAC_SIGNS.index(target_rising)
             target_center = (sign_idx * 30) + 15  # Middle of sign
 
-            target_hour, target_minute = service._find_hour_for_ascendant(
-                1995, 6, 15, target_rising, 51.5, -0.1, "Europe/London"
-            )
-
-            birth = BirthData(
-                year=1995,
-                month=6,
-                day=15,
-                hour=target_hour,
-                minute=target_minute,
-                latitude=51.5,
-                longitude=-0.1,
-                timezone="Europe/London",
-            )
-            chart = provider.calculate_natal_chart(birth)
+            _, _, chart = ascendant_lookup[target_rising]
             actual = chart.points.get("ascendant", {}).get("abs_pos", 0)
 
             error = abs(target_center - actual)
@@ -361,6 +349,15 @@ class TestFindHourForAscendant:
             assert error <= 15, f"{ZODIAC_SIGNS[i]}: error {error:.1f}° exceeds 15° threshold"
 
 
+@pytest.fixture(scope="module")
+def signs_by_quality() -> dict[str, set[str]]:
+    """Inverse of SUN_QUALITY: modality -> set of signs, built once."""
+    by_quality: dict[str, set[str]] = {}
+    for sign in ZODIAC_SIGNS:
+        by_quality.setdefault(SUN_QUALITY[sign], set()).add(sign)
+    return by_quality
+
+
 class TestZodiacMappingsCompleteness:
     """Tests verifying all zodiac mappings are complete."""
 
@@ -400,17 +397,14 @@ class TestZodiacMappingsCompleteness:
             quality = SUN_QUALITY[sign]
             assert quality in ["Cardinal", "Fixed", "Mutable"], f"Invalid quality {quality} for {sign}"
 
-    def test_cardinal_signs_correct(self):
+    def test_cardinal_signs_correct(self, signs_by_quality):
         """Cardinal signs should be Ari, Can, Lib, Cap."""
-        cardinal = [s for s in ZODIAC_SIGNS if SUN_QUALITY[s] == "Cardinal"]
-        assert set(cardinal) == {"Ari", "Can", "Lib", "Cap"}
+        assert signs_by_quality["Cardinal"] == {"Ari", "Can", "Lib", "Cap"}
 
-    def test_fixed_signs_correct(self):
+    def test_fixed_signs_correct(self, signs_by_quality):
         """Fixed signs should be Tau, Leo, Sco, Aqu."""
-        fixed = [s for s in ZODIAC_SIGNS if SUN_QUALITY[s] == "Fixed"]
-        assert set(fixed) == {"Tau", "Leo", "Sco", "Aqu"}
+        assert signs_by_quality["Fixed"] == {"Tau", "Leo", "Sco", "Aqu"}
 
-    def test_mutable_signs_correct(self):
+    def test_mutable_signs_correct(self, signs_by_quality):
         """Mutable signs should be Gem, Vir, Sag, Pis."""
-        mutable = [s for s in ZODIAC_SIGNS if SUN_QUALITY[s] == "Mutable"]
-        assert set(mutable) == {"Gem", "Vir", "Sag", "Pis"}
+        assert signs_by_quality["Mutable"] == {"Gem", "Vir", "Sag", "Pis"}